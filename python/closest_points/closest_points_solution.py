@@ -4,8 +4,16 @@
 Given n points in the plane, find the pair that is closest together.
 """
 
+import heapq
 import math
-from multiprocessing import Process, Value
+import os
+import random
+import tempfile
+from itertools import islice
+from multiprocessing import Pool
+from operator import attrgetter
+
+import numpy as np
 
 
 class Point:
@@ -130,20 +138,95 @@ def get_candidates_from_different_halves(rightmost_left_point, Py, min_distance_
     return [p for p in Py if abs(p.point.x-rightmost_left_point.x) < min_distance_upper_bound]
 
 
+# number of candidates following each candidate (sorted by y) that need to be checked in the strip
+STRIP_WINDOW = 15
+# strips with more candidates than this are checked with NumPy, smaller ones are not worth the overhead
+STRIP_BATCH_THRESHOLD = 16
+
+
+def closest_points_in_strip(xs, ys):
+    """
+    Obtain the closest points among the candidates of a strip, only comparing each candidate with the next STRIP_WINDOW ones
+
+    xs, ys: coordinates of the candidates sorted by coordinate y (lists or arrays)
+
+    Returns (squared distance, i, j) for the closest candidates i < j, or None if there are less than 2 candidates.
+    When several pairs are at the minimum distance, the first one in (i, j) order is returned
+    """
+    m = len(xs)
+    if m < 2:
+        return None
+    if m > STRIP_BATCH_THRESHOLD:
+        SX, SY = np.asarray(xs), np.asarray(ys)
+        if batchable(SX) and batchable(SY):
+            return closest_points_in_strip_batched(SX, SY)
+        xs, ys = SX, SY
+
+    if isinstance(xs, np.ndarray):
+        xs, ys = xs.tolist(), ys.tolist()
+    solution = (math.inf, 0, 0)
+    for i in range(m-1):
+        xi, yi = xs[i], ys[i]
+        for j in range(i+1, min(m, i+STRIP_WINDOW+1)):
+            d2 = (xi - xs[j])**2 + (yi - ys[j])**2
+            if d2 < solution[0]:
+                solution = (d2, i, j)
+    return solution
+
+
+def batchable(coordinates):
+    """
+    Squared distances are computed with 64-bit integers in 'closest_points_in_strip_batched', so integer coordinates
+    can only be batched if the differences between them are below 2^31 (otherwise the exact scalar path is used)
+    """
+    if np.issubdtype(coordinates.dtype, np.floating):
+        return True
+    if not np.issubdtype(coordinates.dtype, np.integer):
+        return False
+    return int(coordinates.max()) - int(coordinates.min()) < 2**31
+
+
+def closest_points_in_strip_batched(SX, SY):
+    """
+    Batched version of 'closest_points_in_strip': the squared distances between each candidate and the next
+    STRIP_WINDOW candidates are computed at once as a matrix whose row i is a sliding window over the candidates
+    that follow candidate i
+    """
+    m = len(SX)
+    window = min(m-1, STRIP_WINDOW)
+
+    # D[i, k] is the squared distance between the candidates i and i+k+1, which only exists if i+k+1 < m
+    J = np.arange(m)[:, None] + np.arange(1, window+1)
+    padding = J >= m
+    J[padding] = m-1
+    D = (SX[J] - SX[:, None])**2 + (SY[J] - SY[:, None])**2
+    D[padding] = np.iinfo(D.dtype).max if np.issubdtype(D.dtype, np.integer) else math.inf
+
+    i, k = divmod(int(np.argmin(D)), window)
+    return D[i, k].item(), i, i+k+1
+
+
 def closest_points_from_different_halves(candidates, partial_solution):
     """
     Obtain the closest points among the previously selected candidates
     Returns the closest points and their distance to each other
+
+    The square root is only taken for the closest candidates
     """
-    min_distance = partial_solution.d
-    closest_candidates = (partial_solution.p1, partial_solution.p2)
-    for i in range(len(candidates)-1):
-        for j in range(i+1, min(len(candidates), i+16)):
-            d = distance(candidates[i].point, candidates[j].point)
-            if d < min_distance:
-                min_distance = d
-                closest_candidates = (candidates[i].point, candidates[j].point)
-    return PointDistance(closest_candidates[0], closest_candidates[1], min_distance)
+    return closest_points_from_strip([c.point for c in candidates], partial_solution)
+
+
+def closest_points_from_strip(points, partial_solution):
+    """
+    Same as 'closest_points_from_different_halves' when the candidates are given as a list of points sorted by y
+    """
+    strip_solution = closest_points_in_strip([p.x for p in points], [p.y for p in points])
+    if strip_solution is not None:
+        d2, i, j = strip_solution
+        d = math.sqrt(d2)
+        if d < partial_solution.d:
+            return PointDistance(points[i], points[j], d)
+    return partial_solution
 
 
 def closest_points(Px, Py) -> PointDistance:
@@ -167,81 +250,359 @@ def closest_points(Px, Py) -> PointDistance:
     return closest_points_from_different_halves(candidates, partial_solution)
 
 
+y_coordinate = attrgetter('y')
+
+
+def closest_points_in_range(P, lo, hi) -> PointDistance:
+    """
+    Variant of 'closest_points' that works in place over the positions lo...hi-1 of a single list of points
+
+    P[lo:hi] must be sorted by coordinate x on entry and is sorted by coordinate y on exit, like in merge sort:
+    the recursive calls sort each half by y and then both halves are merged in one linear pass.
+    Therefore, there is no need to presort the points by y nor to split Py at each level, and no
+    PyElement is created
+    """
+    n = hi - lo
+    if n <= 3:
+        solution = quadratic_solution(P[lo:hi])
+        P[lo:hi] = sorted(P[lo:hi], key=y_coordinate)
+        return solution
+
+    mid = lo + n//2
+    rightmost_left_point = P[mid-1]
+
+    left_solution = closest_points_in_range(P, lo, mid)
+    right_solution = closest_points_in_range(P, mid, hi)
+    partial_solution = min(left_solution, right_solution, key=lambda pointDistance: pointDistance.d)
+
+    # P[lo:mid] and P[mid:hi] are sorted by y, Timsort detects both runs and merges them in linear time
+    P[lo:hi] = sorted(P[lo:hi], key=y_coordinate)
+
+    strip_lo, strip_hi = rightmost_left_point.x - partial_solution.d, rightmost_left_point.x + partial_solution.d
+    candidates = [p for p in P[lo:hi] if strip_lo < p.x < strip_hi]
+    return closest_points_from_strip(candidates, partial_solution)
+
+
 def nlogn_solution(points):
     """
     divide and conquer algorithm, O(n log n)
 
-    points: list of tuples, each tuple representing a point (x,y) in the plane
+    points: list of Points or, in columnar mode, array of shape (n, 2) (see 'nlogn_solution_columnar')
     """
+    if isinstance(points, np.ndarray):
+        return nlogn_solution_columnar(points)
+    P = sorted(points, key=attrgetter('x'))
+    return closest_points_in_range(P, 0, len(P))
 
-    return closest_points(*sort_points(points))
 
+# ==== COLUMNAR MODE ====
+#
+# The points are stored in an array of shape (n, 2) whose rows are the coordinates (x, y) of each point.
+# The recursion works on integer positions instead of Point/PyElement objects:
+# - X, Y: coordinates of the points sorted by coordinate x (play the role of Px)
+# - Py: positions in X, Y sorted by coordinate y (play the role of the x_position of PyElement)
+# - partial solutions are tuples (squared distance, position of p1, position of p2)
+#
+# Point and PointDistance objects are only created for the final answer
 
-def copy_solution_to_shared_memory(pd, shmem):
-    shmem.p1.x.value = pd.p1.x
-    shmem.p1.y.value = pd.p1.y
-    shmem.p2.x.value = pd.p2.x
-    shmem.p2.y.value = pd.p2.y
-    shmem.d.value = pd.d
+# below this size, the closest points are found by brute force instead of splitting the input further
+COLUMNAR_LEAF_SIZE = 8
 
 
-def closest_points_par(Px, Py, shmem, par_threshold):
+def to_columnar(P):
     """
-    Parallel version of 'closest_points'
+    list of Points -> array of shape (n, 2)
+    """
+    return np.array([(p.x, p.y) for p in P])
+
 
-    Calculate the number of points recursively by splitting the work and starting a new process on each recursion
-    Once the level of parallelism is reached, no more processes are created and the remaining work is delegated to the
-    sequential version of this function
+def columnar_dtype(points):
+    """
+    Integer coordinates are widened to 64 bits so that squared distances do not overflow
+    (as long as the differences between coordinates are below 2^31)
+    """
+    return np.dtype(np.int64) if np.issubdtype(points.dtype, np.integer) else np.dtype(np.float64)
 
-    Each child proccess calculates the solution corresponding to its input and shares that information with its parent 
-    through shared memory map
 
-    shmem (shared memory) is a tuple of 2 points, where each point is a tuple of 2 Value objects corresponding
-    to coordinates x and y
-    There is no need to synchronize the access to shared memory as only the child writes to it and the parent waits for
-    the child to finish before reading
+def sort_points_columnar(points):
     """
-    if len(Px) == 2:
-        copy_solution_to_shared_memory(PointDistance(Px[0], Px[1], distance(Px[0], Px[1])), shmem)
-
-    elif len(Px) > par_threshold:
-        # shared memory values to share data with child processes
-        left_solution = PointDistance(Point(Value('d', math.inf, lock=False), Value('d', math.inf, lock=False)), Point(
-            Value('d', math.inf, lock=False), Value('d', math.inf, lock=False)), Value('d', math.inf, lock=False))
-        right_solution = PointDistance(Point(Value('d', math.inf, lock=False), Value('d', math.inf, lock=False)), Point(
-            Value('d', math.inf, lock=False), Value('d', math.inf, lock=False)), Value('d', math.inf, lock=False))
-
-        # closest points in each half
-        Lx, Ly = left_half_points(Px, Py)
-        Rx, Ry = right_half_points(Px, Py)
-
-        pleft = Process(target=closest_points_par, args=(Lx, Ly, left_solution, par_threshold))
-        pleft.start()
-        closest_points_par(Rx, Ry, right_solution, par_threshold)
-        pleft.join()
-        partial_solution = min(left_solution, right_solution, key=lambda pointDistance: pointDistance.d.value)
-
-        candidates = get_candidates_from_different_halves(Lx[-1], Py, partial_solution.d.value)
-        global_solution = closest_points_from_different_halves(candidates, PointDistance(
-            Point(partial_solution.p1.x.value, partial_solution.p1.y.value), Point(partial_solution.p2.x.value, partial_solution.p2.y.value), partial_solution.d.value))
-        copy_solution_to_shared_memory(global_solution, shmem)
-    else:
-        # DEFAULTING TO SEQUENTIAL ALGORITHM
-        copy_solution_to_shared_memory(closest_points(Px, Py), shmem)
+    points -> X, Y, Py
+    """
+    dtype = columnar_dtype(points)
+    order = np.argsort(points[:, 0], kind='stable')
+    X = points[order, 0].astype(dtype, copy=False)
+    Y = points[order, 1].astype(dtype, copy=False)
+    Py = np.argsort(Y, kind='stable')
+    return X, Y, Py
+
+
+def squared_distance(x1, y1, x2, y2):
+    return (x1 - x2)**2 + (y1 - y2)**2
+
+
+def closest_points_brute_force_columnar(X, Y, lo, hi):
+    """
+    Closest points among the positions lo...hi-1, O(n^2)
+    """
+    xs = X[lo:hi].tolist()
+    ys = Y[lo:hi].tolist()
+    solution = (math.inf, lo, lo)
+    for i in range(len(xs)-1):
+        for j in range(i+1, len(xs)):
+            d2 = squared_distance(xs[i], ys[i], xs[j], ys[j])
+            if d2 < solution[0]:
+                solution = (d2, lo+i, lo+j)
+    return solution
+
+
+def closest_points_from_different_halves_columnar(X, Y, candidates, partial_solution):
+    """
+    Columnar counterpart of 'closest_points_from_different_halves'
+
+    candidates: positions in X, Y sorted by coordinate y
+    """
+    strip_solution = closest_points_in_strip(X[candidates], Y[candidates])
+    if strip_solution is not None and strip_solution[0] < partial_solution[0]:
+        d2, i, j = strip_solution
+        return (d2, candidates[i], candidates[j])
+    return partial_solution
+
+
+def closest_points_columnar(X, Y, Py, lo, hi):
+    """
+    Columnar counterpart of 'closest_points' restricted to the positions lo...hi-1
+
+    Py: positions in the range lo...hi-1 sorted by coordinate y
+    """
+    n = hi - lo
+    if n <= COLUMNAR_LEAF_SIZE:
+        return closest_points_brute_force_columnar(X, Y, lo, hi)
 
+    left_half_upper_bound = lo + math.ceil(n/2)
+    right_half_lower_bound = lo + math.floor(n/2)
 
-def nlogn_solution_par(points, num_processes):
+    left_solution = closest_points_columnar(X, Y, Py[Py < left_half_upper_bound], lo, left_half_upper_bound)
+    right_solution = closest_points_columnar(X, Y, Py[Py >= right_half_lower_bound], right_half_lower_bound, hi)
+    partial_solution = min(left_solution, right_solution, key=lambda solution: solution[0])
+
+    rightmost_left_x = X[left_half_upper_bound-1]
+    candidates = Py[(X[Py] - rightmost_left_x)**2 < partial_solution[0]]
+    return closest_points_from_different_halves_columnar(X, Y, candidates, partial_solution)
+
+
+def nlogn_solution_columnar(points):
+    """
+    divide and conquer algorithm, O(n log n), on the columnar representation of the points
+
+    points: array of shape (n, 2), row i being the coordinates (x, y) of the i-th point
+    """
+    X, Y, Py = sort_points_columnar(points)
+    d2, i, j = closest_points_columnar(X, Y, Py, 0, len(X))
+    return PointDistance(Point(X[i].item(), Y[i].item()), Point(X[j].item(), Y[j].item()), math.sqrt(d2))
+
+
+# the coordinates shared with the workers of 'nlogn_solution_par' are kept in a memory-mapped file,
+# which is RAM-backed when /dev/shm is available
+SHARED_MEMORY_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+def closest_points_in_slab(file_name, n, dtype, lo, hi):
+    """
+    Task run by the workers of 'nlogn_solution_par'
+
+    Maps the file holding the coordinates X, Y of the n points sorted by coordinate x and returns the
+    solution (squared distance, position of p1, position of p2) for the slab of positions lo...hi-1
+    """
+    X, Y = np.memmap(file_name, dtype=dtype, mode='r', shape=(2, n))
+    Py = lo + np.argsort(Y[lo:hi], kind='stable')
+    d2, i, j = closest_points_columnar(X, Y, Py, lo, hi)
+    return d2, int(i), int(j)
+
+
+def closest_points_from_different_slabs(X, Y, boundary, hi, partial_solution):
     """
-    Parallel version of 'nlogn_solution' where num_processes is the number of processes to spawn
+    Given the solution for the positions 0...hi-1 where the pairs of points with both points on the same side of
+    'boundary' have already been considered, this function checks the pairs with one point on each side.
 
-    num_processes MUST be a power of 2
+    As in 'get_candidates_from_different_halves', the candidates must lie within the current minimum distance of
+    the rightmost point on the left side
     """
-    # shared memory values: not really needed as no new process is spawned here. However, needed to respect the signature of 'closest_points_par'
-    solution = PointDistance(Point(Value('d', math.inf, lock=False), Value('d', math.inf, lock=False)), Point(
-        Value('d', math.inf, lock=False), Value('d', math.inf, lock=False)), Value('d', math.inf, lock=False))
-    par_threshold = len(points)//num_processes
-    closest_points_par(*sort_points(points), solution, par_threshold)
-    return PointDistance(Point(solution.p1.x.value, solution.p1.y.value), Point(solution.p2.x.value, solution.p2.y.value), solution.d.value)
+    d2 = partial_solution[0]
+    d = math.sqrt(d2)
+    rightmost_left_x = X[boundary-1]
+    strip_lo = np.searchsorted(X[:boundary], rightmost_left_x - d, side='left')
+    strip_hi = boundary + np.searchsorted(X[boundary:hi], rightmost_left_x + d, side='right')
+
+    strip = np.arange(strip_lo, strip_hi)
+    strip = strip[(X[strip] - rightmost_left_x)**2 < d2]
+    candidates = strip[np.argsort(Y[strip], kind='stable')]
+    return closest_points_from_different_halves_columnar(X, Y, candidates, partial_solution)
+
+
+def nlogn_solution_par(points, num_processes, pool=None):
+    """
+    Parallel version of 'nlogn_solution' where num_processes is the number of slabs solved in parallel
+
+    The points are sorted by coordinate x and copied to a shared memory-mapped file, then split into num_processes slabs
+    of consecutive points that are solved by the workers of a process pool. Finally, the slabs are merged
+    from left to right by checking the points close to the boundary between them.
+
+    points: list of Points or array of shape (n, 2) (see 'nlogn_solution_columnar')
+    pool: multiprocessing pool to run the slabs on. If not given, a pool of num_processes workers is created
+    for this call only: a long-lived pool should be passed to avoid paying the start-up cost on every call
+    """
+    if not isinstance(points, np.ndarray):
+        points = to_columnar(points)
+    n = len(points)
+    dtype = columnar_dtype(points)
+    num_slabs = max(1, min(num_processes, n//2))
+    bounds = [n*k//num_slabs for k in range(num_slabs+1)]
+
+    with tempfile.NamedTemporaryFile(dir=SHARED_MEMORY_DIR) as f:
+        X, Y = np.memmap(f.name, dtype=dtype, mode='w+', shape=(2, n))
+        order = np.argsort(points[:, 0], kind='stable')
+        X[:] = points[order, 0]
+        Y[:] = points[order, 1]
+        del order
+
+        tasks = [(f.name, n, dtype, lo, hi) for lo, hi in zip(bounds, bounds[1:])]
+        if pool is None:
+            with Pool(num_processes) as pool:
+                slab_solutions = pool.starmap(closest_points_in_slab, tasks)
+        else:
+            slab_solutions = pool.starmap(closest_points_in_slab, tasks)
+
+        solution = slab_solutions[0]
+        for k in range(1, num_slabs):
+            partial_solution = min(solution, slab_solutions[k], key=lambda solution: solution[0])
+            solution = closest_points_from_different_slabs(X, Y, bounds[k], bounds[k+1], partial_solution)
+
+        d2, i, j = solution
+        return PointDistance(Point(X[i].item(), Y[i].item()), Point(X[j].item(), Y[j].item()), math.sqrt(d2))
+
+
+# ==== QUERIES ====
+
+
+def pairs_within_distance(points, r):
+    """
+    Generator of the PointDistance of all the pairs of points at distance less than or equal to r
+
+    The points are hashed into a grid of squares of side r, so that each point only needs to be compared with
+    the points in the 9 squares around it. Apart from the grid, memory does not depend on the number of pairs found.
+    When r is 0, only identical points are paired.
+
+    points: list of Points
+    """
+    def square(p):
+        return (math.floor(p.x/r), math.floor(p.y/r)) if r > 0 else (p.x, p.y)
+
+    neighbourhood = [(i, j) for i in (-1, 0, 1) for j in (-1, 0, 1)] if r > 0 else [(0, 0)]
+    r2 = r*r
+    grid = {}
+    for p in points:
+        square_x, square_y = square(p)
+        for i, j in neighbourhood:
+            for q in grid.get((square_x+i, square_y+j), ()):
+                if (q.x - p.x)**2 + (q.y - p.y)**2 <= r2:
+                    yield PointDistance(q, p, distance(q, p))
+        grid.setdefault((square_x, square_y), []).append(p)
+
+
+def k_closest_pairs(points, k):
+    """
+    Generator of the PointDistance of the k closest pairs of points, sorted by distance
+
+    The search radius starts at the distance between the closest points and is doubled until there are at least k pairs
+    within it. Then, the k closest ones are selected among those pairs with a heap, hence memory is O(n + k)
+
+    points: list of Points
+    """
+    n = len(points)
+    k = min(k, n*(n-1)//2)
+    if k <= 0:
+        return
+
+    r = nlogn_solution(points).d
+    if r == 0:
+        # the radius must be able to grow, start at the scale of the typical distance between consecutive points
+        r = distance(Point(min(p.x for p in points), min(p.y for p in points)),
+                     Point(max(p.x for p in points), max(p.y for p in points)))/n
+    while r > 0 and sum(1 for _ in islice(pairs_within_distance(points, r), k)) < k:
+        r *= 2
+
+    yield from heapq.nsmallest(k, pairs_within_distance(points, r), key=lambda pointDistance: pointDistance.d)
+
+
+# ==== RANDOMIZED GRID ====
+
+
+def grid_solution(points, rng=random):
+    """
+    randomized algorithm based on hashing the points into a grid, O(n) expected time
+    (Algorithm Design, section 13.7)
+
+    The points are processed in random order while keeping a grid of squares of side d, where d is the minimum
+    distance among the points processed so far. Two points closer than d must lie in the same or in adjacent squares,
+    therefore each new point only needs to be compared with the points in the 9 squares around it.
+    Whenever the new point is closer than d to any of them, d decreases and the grid is rebuilt.
+
+    The grid is rebuilt when processing the i-th point with probability at most 2/i (the new point must be one of the
+    two closest points among the first i) and rebuilding it is O(i), hence the expected cost of each step is O(1)
+
+    points: list of Points or array of shape (n, 2) (see 'nlogn_solution_columnar')
+    rng: source of randomness used to shuffle the points
+    """
+    if isinstance(points, np.ndarray):
+        xs, ys = points[:, 0].tolist(), points[:, 1].tolist()
+        P = None
+    else:
+        xs, ys = [p.x for p in points], [p.y for p in points]
+        P = points
+
+    order = list(range(len(xs)))
+    rng.shuffle(order)
+
+    def build_grid(k):
+        """
+        grid of squares of side d with the first k points, squares are identified by their lower left corner
+        """
+        side = math.sqrt(solution[0])
+        grid = {}
+        for i in order[:k]:
+            grid.setdefault((math.floor(xs[i]/side), math.floor(ys[i]/side)), []).append(i)
+        return side, grid
+
+    i, j = order[0], order[1]
+    solution = (squared_distance(xs[i], ys[i], xs[j], ys[j]), i, j)
+    if solution[0] > 0:
+        side, grid = build_grid(2)
+
+    for k in range(2, len(order)):
+        if solution[0] == 0:
+            break
+        j = order[k]
+        xj, yj = xs[j], ys[j]
+        square_x, square_y = math.floor(xj/side), math.floor(yj/side)
+        new_solution = solution
+        for neighbour_x in (square_x-1, square_x, square_x+1):
+            for neighbour_y in (square_y-1, square_y, square_y+1):
+                for i in grid.get((neighbour_x, neighbour_y), ()):
+                    d2 = (xs[i] - xj)**2 + (ys[i] - yj)**2
+                    if d2 < new_solution[0]:
+                        new_solution = (d2, i, j)
+
+        if new_solution is solution:
+            grid.setdefault((square_x, square_y), []).append(j)
+        else:
+            solution = new_solution
+            if solution[0] > 0:
+                side, grid = build_grid(k+1)
+
+    d2, i, j = solution
+    if P is None:
+        return PointDistance(Point(xs[i], ys[i]), Point(xs[j], ys[j]), math.sqrt(d2))
+    return PointDistance(P[i], P[j], math.sqrt(d2))
 
 
 def read_test_file(file_name):
@@ -253,6 +614,16 @@ def read_test_file(file_name):
         return [Point(x,y) for x,y in list(struct.iter_unpack('ii', data))]
 
 
+def read_test_file_columnar(file_name):
+    """
+    Memory-maps a binary file of points (pairs of int32 coordinates (x, y), as generated by 'test_file.c')
+    and returns it as an array of shape (n, 2) suitable for 'nlogn_solution'
+
+    No data is copied: the pages of the file are loaded on demand by the OS when the solver reads them
+    """
+    return np.memmap(file_name, dtype=np.intc, mode='r').reshape(-1, 2)
+
+
 if __name__ == "__main__":
 
     from random import sample
@@ -269,9 +640,14 @@ if __name__ == "__main__":
 
     def main():
         # P = file_test(sys.argv[1])
+        # P_columnar = read_test_file_columnar(sys.argv[1])
         P = random_sample_test(1000000)
+        P_columnar = to_columnar(P)
         print(f"nlogn_solution {timeit.timeit(lambda: nlogn_solution(P), number=1)}")
-        print(f"nlogn_solution_par 4 {timeit.timeit(lambda: nlogn_solution_par(P, 4), number=1)}")
-        print(f"nlogn_solution_par 8 {timeit.timeit(lambda: nlogn_solution_par(P, 8), number=1)}")
+        print(f"nlogn_solution columnar {timeit.timeit(lambda: nlogn_solution(P_columnar), number=1)}")
+        print(f"grid_solution {timeit.timeit(lambda: grid_solution(P), number=1)}")
+        with Pool(8) as pool:
+            for num_processes in (2, 3, 4, 6, 8):
+                print(f"nlogn_solution_par {num_processes} {timeit.timeit(lambda: nlogn_solution_par(P_columnar, num_processes, pool), number=1)}")
 
     main()
@@ -1,6 +1,7 @@
 from closest_points.closest_points_solution import *
 import hypothesis.strategies as st
-from hypothesis import given, example, note
+from hypothesis import given, example, note, settings
+import random
 from random import sample
 import pytest
 
@@ -40,9 +41,29 @@ def test_nlogn_repeat_points():
     assert nlogn_solution(P) == PointDistance(Point(3,9),Point(3,9),0)
 
 
+@pytest.fixture(scope="module")
+def pool():
+    with Pool(4) as pool:
+        yield pool
+
+
 def test_nlogn_solution_par():
     P=[Point(0, 1), Point(0, 3), Point(2, 0), Point(0, 0)]
-    assert nlogn_solution_par(P,1) == PointDistance(Point(0,0),Point(0,1),1)
+    solution = nlogn_solution_par(P,1)
+    assert {solution.p1, solution.p2} == {Point(0,0),Point(0,1)}
+    assert solution.d == 1
+
+
+def test_nlogn_solution_par_inter_slab_solution(pool):
+    # the closest points are in the first and last slabs, separated by slabs narrower than their distance
+    P=[Point(-100,0),Point(0,0),Point(10,5000),Point(10,-5000),Point(11,8000),Point(11,-8000),Point(20,0),Point(120,0)]
+    assert nlogn_solution_par(P, 4, pool) == PointDistance(Point(0,0),Point(20,0),20)
+
+
+@pytest.mark.parametrize("num_processes", [3, 6, 12])
+def test_nlogn_solution_par_any_number_of_processes(num_processes, pool):
+    P=[Point(x, y) for x, y in zip(sample(range(10000), 1000), sample(range(10000), 1000))]
+    assert nlogn_solution_par(P, num_processes, pool).d == quadratic_solution(P).d
 
 
 def test_sort_points():
@@ -85,5 +106,121 @@ def test_quadratic_vs_nlogn(P):
     assert quadratic_solution(P).d == nlogn_solution(P).d
 
 @given(st.lists(st.builds(point_strategy, st.integers(0,1000), st.integers(0,1000)), min_size=2, max_size=100, unique=True))
-def test_nlogn_vs_nlogn_par(P):
-    assert nlogn_solution_par(P,4) == nlogn_solution(P)    
\ No newline at end of file
+def test_nlogn_vs_nlogn_par(pool, P):
+    assert nlogn_solution_par(P,4,pool).d == nlogn_solution(P).d    
+
+def test_sort_points_columnar():
+    X, Y, Py = sort_points_columnar(np.array([(0, 0), (3, 4), (2, 5), (1, 4)]))
+    assert X.tolist() == [0, 1, 2, 3]
+    assert Y.tolist() == [0, 4, 5, 4]
+    assert Py.tolist() == [0, 1, 3, 2]
+
+
+def test_nlogn_columnar_inter_half_solution():
+    P=[Point(2,-100),Point(0,0),Point(9,100),Point(10,0),Point(11,100),Point(20,-100),Point(20,0),Point(30,30),Point(40,40),Point(50,50)]
+    assert nlogn_solution(to_columnar(P)) == PointDistance(Point(9,100),Point(11,100),2)
+
+
+def test_nlogn_columnar_int32_coordinates():
+    # squared distances must not overflow the 32-bit input coordinates
+    P=np.array([(0, 0), (2**31-1, 2**31-1), (-2**31, 0)], dtype=np.int32)
+    assert nlogn_solution(P) == PointDistance(Point(-2**31, 0), Point(0, 0), 2**31)
+
+@given(st.lists(st.builds(point_strategy, st.integers(0,1000), st.integers(0,1000)), min_size=2, max_size=100, unique=True))
+def test_nlogn_vs_nlogn_columnar(P):
+    assert nlogn_solution(to_columnar(P)).d == nlogn_solution(P).d
+
+
+def test_closest_points_in_strip_window():
+    # the closest candidates are more than STRIP_WINDOW positions apart and must not be compared
+    xs = [0] + [100*k for k in range(1, STRIP_WINDOW+1)] + [1]
+    ys = list(range(len(xs)))
+    assert closest_points_in_strip(xs, ys) == (100**2 + 1, 0, 1)
+
+def test_closest_points_in_strip_first_pair_on_ties():
+    xs, ys = np.array([0, 0, 0, 0]), np.array([0, 1, 2, 3])
+    assert closest_points_in_strip(xs, ys) == closest_points_in_strip_batched(xs, ys) == (1, 0, 1)
+
+@given(st.lists(st.tuples(st.integers(0,1000), st.integers(0,1000)), min_size=2, max_size=100))
+def test_closest_points_in_strip_scalar_vs_batched(P):
+    xs, ys = [x for x, _ in P], [y for _, y in P]
+    assert closest_points_in_strip(xs[:STRIP_BATCH_THRESHOLD], ys[:STRIP_BATCH_THRESHOLD]) == \
+        closest_points_in_strip_batched(np.array(xs[:STRIP_BATCH_THRESHOLD]), np.array(ys[:STRIP_BATCH_THRESHOLD]))
+
+
+def test_read_test_file_columnar(tmp_path):
+    file_name = tmp_path / "points.bin"
+    np.array([(3, 9), (1, 5), (10, 5), (3, 10)], dtype=np.intc).tofile(file_name)
+    P = read_test_file_columnar(file_name)
+    assert isinstance(P, np.memmap)
+    assert P.tolist() == [[3, 9], [1, 5], [10, 5], [3, 10]]
+    assert nlogn_solution(P) == PointDistance(Point(3, 9), Point(3, 10), 1)
+    assert read_test_file(file_name) == [Point(3, 9), Point(1, 5), Point(10, 5), Point(3, 10)]
+
+
+def test_grid_solution():
+    P=[Point(2,-100),Point(0,0),Point(9,100),Point(10,0),Point(11,100),Point(20,-100),Point(20,0)]
+    solution = grid_solution(P, random.Random(0))
+    assert {solution.p1, solution.p2} == {Point(9,100),Point(11,100)}
+    assert solution.d == 2
+
+def test_grid_solution_repeat_points():
+    P=[Point(3,9),Point(1,5),Point(10,5),Point(3,9),Point(1,6)]
+    assert grid_solution(P) == PointDistance(Point(3,9),Point(3,9),0)
+
+def test_grid_solution_columnar():
+    P=np.array([(3,9),(1,5),(10,5),(20,20),(20,21)])
+    solution = grid_solution(P)
+    assert {solution.p1, solution.p2} == {Point(20,20),Point(20,21)}
+
+@given(st.lists(st.builds(point_strategy, st.integers(0,1000), st.integers(0,1000)), min_size=2, max_size=100))
+def test_quadratic_vs_grid(P):
+    assert quadratic_solution(P).d == grid_solution(P).d
+
+
+def test_closest_points_in_range_sorts_by_y():
+    P = sorted([Point(3,9),Point(1,5),Point(0,1),Point(5,3),Point(8,6),Point(20,20),Point(40,40)], key=lambda p: p.x)
+    closest_points_in_range(P, 0, len(P))
+    assert P == sorted(P, key=lambda p: p.y)
+
+@given(st.lists(st.builds(point_strategy, st.integers(0,1000), st.integers(0,1000)), min_size=2, max_size=100))
+def test_closest_points_vs_closest_points_in_range(P):
+    Px = sorted(P, key=lambda p: p.x)
+    assert closest_points(*sort_points(P)).d == closest_points_in_range(Px, 0, len(Px)).d
+
+
+def all_pairs(P):
+    return [PointDistance(P[i], P[j], distance(P[i], P[j])) for i in range(len(P)-1) for j in range(i+1, len(P))]
+
+
+def test_pairs_within_distance():
+    P=[Point(0,0),Point(3,4),Point(0,5),Point(10,10),Point(0,0)]
+    assert sorted(pd.d for pd in pairs_within_distance(P, 5)) == [0, math.sqrt(10), 5, 5, 5, 5]
+
+def test_pairs_within_distance_0():
+    P=[Point(1,1),Point(3,4),Point(1,1),Point(1,2)]
+    assert list(pairs_within_distance(P, 0)) == [PointDistance(Point(1,1),Point(1,1),0)]
+
+def test_k_closest_pairs():
+    P=[Point(0,0),Point(0,1),Point(0,3),Point(0,6),Point(0,10)]
+    assert [pd.d for pd in k_closest_pairs(P, 3)] == [1, 2, 3]
+
+def test_k_closest_pairs_more_than_available():
+    P=[Point(0,0),Point(0,0),Point(1,1)]
+    assert len(list(k_closest_pairs(P, 10))) == 3
+
+@given(st.lists(st.builds(point_strategy, st.integers(0,100), st.integers(0,100)), min_size=2, max_size=50), st.integers(0,50))
+def test_pairs_within_distance_vs_all_pairs(P, r):
+    assert sorted(pd.d for pd in pairs_within_distance(P, r)) == sorted(pd.d for pd in all_pairs(P) if pd.d <= r)
+
+@given(st.lists(st.builds(point_strategy, st.integers(0,100), st.integers(0,100)), min_size=2, max_size=50), st.integers(1,50))
+def test_k_closest_pairs_vs_all_pairs(P, k):
+    assert [pd.d for pd in k_closest_pairs(P, k)] == sorted(pd.d for pd in all_pairs(P))[:k]
+
+
+@settings(deadline=None, max_examples=20)
+@given(st.randoms(use_true_random=False))
+def test_quadratic_vs_nlogn_large_coordinates(rng):
+    # strips are wide enough to be checked in batch, but squared distances do not fit in 64 bits
+    P = [Point(2**34+rng.randint(-2**33, 2**33), rng.randint(0, 2**35)) for _ in range(500)]
+    assert quadratic_solution(P).d == nlogn_solution(P).d
@@ -0,0 +1,196 @@
+"""
+Closest pair of a set of points that changes over time: points can be inserted and deleted and the closest pair
+is available at any time without recomputing it from scratch.
+"""
+
+import math
+
+from sortedcontainers import SortedList
+
+from closest_points.closest_points_solution import PointDistance
+
+
+class DynamicClosestPoints:
+    """
+    Each point keeps a neighbour: the nearest point at the time the neighbour was calculated. The neighbour of a point
+    is only recalculated when the point is inserted or when its neighbour is deleted, so it may become outdated when
+    closer points are inserted later on. However, the closest pair is always among the pairs (point, neighbour):
+
+    Let (a, b) be the closest pair and assume that the neighbour of a was calculated after the neighbour of b.
+    At that time, b was already present (its neighbour had been calculated) and so the neighbour of a was at distance
+    <= d(a, b). As that neighbour has not been deleted since (otherwise the neighbour of a would have been recalculated),
+    the neighbour of a is at distance d(a, b).
+
+    The pairs (point, neighbour) are kept sorted by distance, so that the closest pair is the first one.
+
+    Neighbours are found with a grid of squares with ~1 point per square on average, by searching the squares in rings
+    of increasing size around the point. For points uniformly distributed, the search is O(1) on average and each update
+    is O(log n). The grid is rebuilt when the number of points doubles or drops to a quarter, which is O(1) amortized
+    per update.
+
+    Limitations: there is no polylog worst-case bound.
+    - Clustered or collinear points concentrate in a few squares (or leave most of them empty), and then a neighbour
+    search can be O(n).
+    - Neighbours are not refreshed on insertion, so many points can share the same neighbour (e.g. points inserted
+    at decreasing distances from the same point) and deleting that point triggers one neighbour search for each of them.
+    """
+
+    def __init__(self, points=()):
+        self.points = {}  # key -> Point
+        self.neighbour = {}  # key -> (squared distance, key of neighbour)
+        self.pointed_by = {}  # key -> keys of the points whose neighbour is this one
+        self.distances = SortedList()  # (squared distance, key) for each point with a neighbour
+        self.next_key = 0
+        self.grid = {}  # square -> keys of the points in the square
+        self.side = 1
+        self.grid_size = 0
+        self.min_square = self.max_square = (0, 0)
+        for p in points:
+            self.insert(p)
+
+    def __len__(self):
+        return len(self.points)
+
+    def insert(self, p):
+        """
+        Inserts point p and returns the key to delete it
+        """
+        key = self.next_key
+        self.next_key += 1
+        self.points[key] = p
+        self.pointed_by[key] = set()
+        if len(self.points) > 2*self.grid_size:
+            self.build_grid()
+        else:
+            self.add_to_grid(key)
+
+        if len(self.points) == 2:
+            # the other point did not have a neighbour so far
+            for k in self.points:
+                self.update_neighbour(k)
+        else:
+            self.update_neighbour(key)
+        return key
+
+    def delete(self, key):
+        """
+        Deletes the point corresponding to key
+        """
+        self.remove_from_grid(key)
+        del self.points[key]
+        self.set_neighbour(key, None)
+        dependents = list(self.pointed_by[key])
+        for k in dependents:
+            self.set_neighbour(k, None)
+        del self.pointed_by[key]
+        for k in dependents:
+            self.update_neighbour(k)
+        if len(self.points) < self.grid_size//4:
+            self.build_grid()
+
+    def closest_pair(self) -> PointDistance:
+        """
+        Returns the closest pair of points or None if there are less than 2 points
+        """
+        if not self.distances:
+            return None
+        d2, key = self.distances[0]
+        return PointDistance(self.points[key], self.points[self.neighbour[key][1]], math.sqrt(d2))
+
+    def update_neighbour(self, key):
+        self.set_neighbour(key, self.nearest_neighbour(key))
+
+    def set_neighbour(self, key, neighbour):
+        if key in self.neighbour:
+            d2, old_neighbour = self.neighbour.pop(key)
+            self.distances.remove((d2, key))
+            self.pointed_by[old_neighbour].discard(key)
+        if neighbour is not None:
+            d2, new_neighbour = neighbour
+            self.neighbour[key] = neighbour
+            self.distances.add((d2, key))
+            self.pointed_by[new_neighbour].add(key)
+
+    def nearest_neighbour(self, key):
+        """
+        Returns (squared distance, key) of the nearest point to the point corresponding to key, or None if there are no
+        more points
+
+        The squares are searched in rings around the square of the point: a point in the ring k+1 is at distance
+        >= k * side, therefore the search stops once a point closer than that has been found
+        """
+        p = self.points[key]
+        square_x, square_y = self.square(p)
+        max_ring = max(square_x - self.min_square[0], self.max_square[0] - square_x,
+                       square_y - self.min_square[1], self.max_square[1] - square_y)
+        solution = None
+        for k in range(max_ring+1):
+            for square in ring(square_x, square_y, k, self.min_square, self.max_square):
+                for other in self.grid.get(square, ()):
+                    if other == key:
+                        continue
+                    q = self.points[other]
+                    d2 = (p.x - q.x)**2 + (p.y - q.y)**2
+                    if solution is None or d2 < solution[0]:
+                        solution = (d2, other)
+            if solution is not None and solution[0] <= (k*self.side)**2:
+                break
+        return solution
+
+    def square(self, p):
+        return (math.floor(p.x/self.side), math.floor(p.y/self.side))
+
+    def add_to_grid(self, key):
+        square = self.square(self.points[key])
+        self.grid.setdefault(square, set()).add(key)
+        self.min_square = (min(self.min_square[0], square[0]), min(self.min_square[1], square[1]))
+        self.max_square = (max(self.max_square[0], square[0]), max(self.max_square[1], square[1]))
+
+    def remove_from_grid(self, key):
+        square = self.square(self.points[key])
+        self.grid[square].discard(key)
+        if not self.grid[square]:
+            del self.grid[square]
+
+    def build_grid(self):
+        """
+        The side of the squares is chosen so that there is one point per square on average
+        """
+        n = len(self.points)
+        self.grid_size = n
+        self.grid = {}
+        if n == 0:
+            return
+
+        xs = [p.x for p in self.points.values()]
+        ys = [p.y for p in self.points.values()]
+        width, height = max(xs) - min(xs), max(ys) - min(ys)
+        if width > 0 and height > 0:
+            self.side = math.sqrt(width*height/n)
+        elif width > 0 or height > 0:
+            self.side = max(width, height)/n
+        else:
+            self.side = 1
+        self.min_square = self.max_square = self.square(next(iter(self.points.values())))
+        for key in self.points:
+            self.add_to_grid(key)
+
+
+def ring(square_x, square_y, k, min_square, max_square):
+    """
+    Squares at distance k from square (square_x, square_y), i.e. the squares surrounding the square of side 2k-1
+    centered at (square_x, square_y), restricted to the rectangle of squares between min_square and max_square
+    """
+    if k == 0:
+        yield (square_x, square_y)
+        return
+    min_x, min_y = max(square_x-k, min_square[0]), max(square_y-k, min_square[1])
+    max_x, max_y = min(square_x+k, max_square[0]), min(square_y+k, max_square[1])
+    for y in (square_y-k, square_y+k):
+        if min_square[1] <= y <= max_square[1]:
+            for x in range(min_x, max_x+1):
+                yield (x, y)
+    for x in (square_x-k, square_x+k):
+        if min_square[0] <= x <= max_square[0]:
+            for y in range(max(min_y, square_y-k+1), min(max_y, square_y+k-1)+1):
+                yield (x, y)
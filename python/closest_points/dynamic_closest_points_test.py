@@ -0,0 +1,87 @@
+from closest_points.closest_points_solution import Point, PointDistance, quadratic_solution
+from closest_points.dynamic_closest_points import DynamicClosestPoints
+import hypothesis.strategies as st
+from hypothesis import given, settings
+
+
+def test_closest_pair_empty():
+    assert DynamicClosestPoints([Point(0, 0)]).closest_pair() is None
+
+
+def test_insert():
+    dcp = DynamicClosestPoints([Point(0, 0), Point(10, 10)])
+    assert dcp.closest_pair().d == DynamicClosestPoints([Point(10, 10), Point(0, 0)]).closest_pair().d
+    dcp.insert(Point(9, 9))
+    assert dcp.closest_pair() == PointDistance(Point(9, 9), Point(10, 10), 2**0.5)
+
+
+def test_delete_closest_point():
+    dcp = DynamicClosestPoints()
+    keys = [dcp.insert(p) for p in [Point(0, 0), Point(10, 0), Point(11, 0), Point(30, 0)]]
+    dcp.delete(keys[2])
+    assert dcp.closest_pair().d == 10
+    dcp.delete(keys[0])
+    solution = dcp.closest_pair()
+    assert {solution.p1, solution.p2} == {Point(10, 0), Point(30, 0)}
+    assert solution.d == 20
+    assert len(dcp) == 2
+
+
+def test_repeat_points():
+    dcp = DynamicClosestPoints([Point(3, 9), Point(1, 5), Point(3, 9)])
+    assert dcp.closest_pair().d == 0
+
+
+@settings(deadline=None)
+@given(st.lists(st.tuples(st.booleans(), st.integers(0, 1000), st.integers(0, 1000)), min_size=2, max_size=100))
+def test_dynamic_vs_quadratic(operations):
+    # each operation either inserts the point (x, y) or deletes the point inserted x operations ago
+    dcp = DynamicClosestPoints()
+    points = {}
+    for insert, x, y in operations:
+        if insert or not points:
+            points[dcp.insert(Point(x, y))] = Point(x, y)
+        else:
+            key = sorted(points)[x % len(points)]
+            dcp.delete(key)
+            del points[key]
+        if len(points) > 1:
+            assert dcp.closest_pair().d == quadratic_solution(list(points.values())).d
+        else:
+            assert dcp.closest_pair() is None
+
+
+def test_delete_shared_neighbour():
+    # all points are inserted at decreasing distances from (0, 0) and have it as neighbour
+    dcp = DynamicClosestPoints()
+    origin = dcp.insert(Point(0, 0))
+    for k in range(20):
+        dcp.insert(Point(1000 - 40*k, 7*k))
+    dcp.delete(origin)
+    P = [Point(1000 - 40*k, 7*k) for k in range(20)]
+    assert dcp.closest_pair().d == quadratic_solution(P).d
+
+
+@settings(deadline=None)
+@given(st.lists(st.tuples(st.booleans(), st.integers(0, 1000)), min_size=2, max_size=100))
+def test_dynamic_vs_quadratic_collinear(operations):
+    dcp = DynamicClosestPoints()
+    points = {}
+    for insert, x in operations:
+        if insert or not points:
+            points[dcp.insert(Point(x, 0))] = Point(x, 0)
+        else:
+            key = sorted(points)[x % len(points)]
+            dcp.delete(key)
+            del points[key]
+        if len(points) > 1:
+            assert dcp.closest_pair().d == quadratic_solution(list(points.values())).d
+
+
+def test_dynamic_clustered_with_outlier():
+    P = [Point(k % 3, k % 5) for k in range(30)] + [Point(10**6, 10**6)]
+    dcp = DynamicClosestPoints()
+    keys = [dcp.insert(p) for p in P]
+    for key in keys[:29]:
+        dcp.delete(key)
+    assert dcp.closest_pair().d == quadratic_solution(P[29:]).d